@@ -141,16 +141,17 @@ class Client:
             files_list = response[2]
             return files_list
         elif response_type == Response.REFUSED:
-            if response[1] == Reason.FILE_NOT_FOUND:
+            reason_type = response[1]
+            if reason_type == Reason.FILE_NOT_FOUND:
                 raise FileNotFoundError
-            if response[1] == Reason.NOT_A_DIRECTORY:
+            elif reason_type == Reason.NOT_A_DIRECTORY:
                 raise NotADirectoryError
             else:
-                raise NotImplementedError
+                raise CorruptedResponse("Invalid reason type in refuse response")
         elif response_type == Response.ERROR:
             self._process_error_response(response)
-
-        raise NotImplementedError
+        else:
+            raise CorruptedResponse("Invalid response type")
 
     def create_file(self, name, directory, timeout=None):
         """ Create a file in the remote directory.
@@ -221,9 +222,11 @@ class Client:
             elif reason_type == Reason.FILE_ALREADY_EXISTS:
                 raise FileExistsError
             else:
-                raise NotImplementedError
+                raise CorruptedResponse("Invalid reason type in refuse response")
         elif response_type == Response.ERROR:
             self._process_error_response(response)
+        else:
+            raise CorruptedResponse("Invalid response type")
 
     def make_directory(self, name, directory, timeout=None):
         """ Create a directory in the remote directory.
@@ -292,9 +295,11 @@ class Client:
             elif reason_type == Reason.FILE_ALREADY_EXISTS:
                 raise FileExistsError
             else:
-                raise NotImplementedError
+                raise CorruptedResponse("Invalid reason type in refuse response")
         elif response_type == Response.ERROR:
             self._process_error_response(response)
+        else:
+            raise CorruptedResponse("Invalid response type")
 
     def upload_file(self, source, destination, name=None, chunk_size=512,
         process_chunk=None, timeout=None):
@@ -902,7 +907,7 @@ class Client:
             # greather than 0, and made a create file request instead)
             if reason_type == Reason.INCORRECT_CHUNK_SIZE:
                 raise ValueError("Chunk size is invalid")
-            elif reason_type == Reason.INVALID_FILE_SIZE:
+            elif reason_type == Reason.INCORRECT_FILE_SIZE:
                 raise ValueError("File size limit is invalid")
             elif reason_type == Reason.INVALID_FILE_NAME:
                 raise FileNameError
@@ -1165,6 +1170,14 @@ class Client:
                 self._download_directory(new_source, destination / name, file_name, chunk_size, process_chunk, timeout)
 
     def _process_error_response(self, response):
+        """ Process an error response.
+
+        It always raises an exception; BadRequestError if the server
+        reported a bad request, UnexpectedError if an unknown error
+        occured on the server side, or CorruptedResponse if the error
+        response can't be understood.
+        """
+
         try:
             reason_type = response[1]
         except Exception as error:
@@ -1178,6 +1191,6 @@ class Client:
             except Exception as error:
                 raise CorruptedResponse("Unable to extract message from error response", error)
 
-            raise UnknownError(message)
+            raise UnexpectedError(message)
         else:
             raise CorruptedResponse("Invalid reason type in error response")
@@ -77,7 +77,7 @@ class CorruptedResponse(RemofileException):
     :ivar str error: Underlying exception message.
     """
 
-    def __init__(self, message, error):
+    def __init__(self, message, error=None):
         super(CorruptedResponse, self).__init__(message)
 
         self.message = message
@@ -95,7 +95,7 @@ class UnexpectedError(RemofileException):
     """
 
     def __init__(self, message):
-        super(UnknownError, self).__init__(message)
+        super(UnexpectedError, self).__init__(message)
 
         self.message = message
 